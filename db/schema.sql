@@ -2,6 +2,7 @@ CREATE TABLE IF NOT EXISTS applications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     vacancy_id TEXT NOT NULL,
     profile_name TEXT NOT NULL,
+    account_id TEXT,
     status TEXT NOT NULL,
     applied_at TEXT NOT NULL,
     cover_letter_snippet TEXT,
@@ -9,6 +10,7 @@ CREATE TABLE IF NOT EXISTS applications (
 );
 
 CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_vacancy ON applications (vacancy_id);
+CREATE INDEX IF NOT EXISTS idx_applications_account_day ON applications (account_id, applied_at);
 
 CREATE TABLE IF NOT EXISTS vacancies_cache (
     id TEXT PRIMARY KEY,
@@ -22,6 +22,7 @@ class Settings:
     CONFIG_DIR: Path
     SEARCH_CONFIG_PATH: Path
     ACTIVE_MODE_PATH: Path
+    ACCOUNTS_CONFIG_PATH: Path
     JOB_BOARD_API_BASE_URL: str
     JOB_BOARD_ACCESS_TOKEN: Optional[str]
     OPENAI_API_KEY: Optional[str]
@@ -42,12 +43,14 @@ def get_settings() -> Settings:
     config_dir = Path(os.getenv("CONFIG_DIR", BASE_DIR / "config"))
     search_config_path = Path(os.getenv("SEARCH_CONFIG_PATH", config_dir / "search_configs_demo.json"))
     active_mode_path = Path(os.getenv("ACTIVE_MODE_PATH", config_dir / "active_mode_demo.json"))
+    accounts_config_path = Path(os.getenv("ACCOUNTS_CONFIG_PATH", config_dir / "accounts_demo.json"))
 
     return Settings(
         DB_PATH=Path(os.getenv("DB_PATH", BASE_DIR / "db" / "demo.db")),
         CONFIG_DIR=config_dir,
         SEARCH_CONFIG_PATH=search_config_path,
         ACTIVE_MODE_PATH=active_mode_path,
+        ACCOUNTS_CONFIG_PATH=accounts_config_path,
         JOB_BOARD_API_BASE_URL=os.getenv("JOB_BOARD_API_BASE_URL", "https://api.example.com"),
         JOB_BOARD_ACCESS_TOKEN=os.getenv("JOB_BOARD_ACCESS_TOKEN") or None,
         OPENAI_API_KEY=os.getenv("OPENAI_API_KEY") or None,
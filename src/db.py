@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 import sqlite3
-from datetime import datetime, timezone
+from datetime import datetime, time, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -26,12 +26,20 @@ def _read_sql(path: Path) -> str:
         return handle.read()
 
 
+def _ensure_account_column(conn: sqlite3.Connection) -> None:
+    """Add applications.account_id to databases created before multi-account support."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(applications)")}
+    if columns and "account_id" not in columns:
+        conn.execute("ALTER TABLE applications ADD COLUMN account_id TEXT")
+
+
 def init_db(demo: bool = False) -> None:
     """Initialize schema and optionally load demo data."""
     base_dir = Path(__file__).resolve().parent.parent
     schema_sql = _read_sql(base_dir / "db" / "schema.sql")
 
     with get_connection() as conn:
+        _ensure_account_column(conn)
         conn.executescript(schema_sql)
         if demo:
             demo_sql = _read_sql(base_dir / "db" / "demo_data.sql")
@@ -47,12 +55,28 @@ def vacancy_already_applied(vacancy_id: str) -> bool:
         return row is not None
 
 
+def count_applications_today(account_id: str) -> int:
+    """Return how many applications the account has sent since UTC midnight.
+
+    Dry-run, skipped, and failed attempts never reach the board, so they do not use up quota.
+    """
+    day_start = datetime.combine(datetime.now(timezone.utc).date(), time.min, tzinfo=timezone.utc)
+    query = """
+        SELECT COUNT(*) FROM applications
+        WHERE account_id = ? AND applied_at >= ? AND status NOT IN ('dry_run', 'skipped', 'error')
+    """
+    with get_connection() as conn:
+        row = conn.execute(query, (account_id, day_start.isoformat())).fetchone()
+        return int(row[0])
+
+
 def save_application(
     vacancy_id: str,
     profile_name: str,
     status: str,
     cover_letter_snippet: Optional[str],
     raw_response: Optional[str],
+    account_id: Optional[str] = None,
 ) -> None:
     """Persist an application attempt."""
     applied_at = datetime.now(timezone.utc).isoformat()
@@ -60,17 +84,18 @@ def save_application(
         INSERT INTO applications (
             vacancy_id,
             profile_name,
+            account_id,
             status,
             applied_at,
             cover_letter_snippet,
             raw_response
         )
-        VALUES (?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
     """
     with get_connection() as conn:
         conn.execute(
             query,
-            (vacancy_id, profile_name, status, applied_at, cover_letter_snippet, raw_response),
+            (vacancy_id, profile_name, account_id, status, applied_at, cover_letter_snippet, raw_response),
         )
         conn.commit()
 
@@ -7,8 +7,10 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import Settings
+from .models.accounts import JobBoardAccount
 from .models.search_profiles import SearchProfile
 from .models.vacancies import Vacancy
 from . import logging_utils
@@ -17,12 +19,35 @@ from . import logging_utils
 class JobBoardClient:
     """Lightweight client for a generic job-board API."""
 
-    def __init__(self, settings: Settings, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        logger: Optional[logging.Logger] = None,
+        account: Optional[JobBoardAccount] = None,
+    ) -> None:
         self.settings = settings
+        self.account = account
         self.base_url = settings.JOB_BOARD_API_BASE_URL.rstrip("/")
-        self.session = requests.Session()
+        self.session = self._build_session(account)
         self.logger = logger or logging_utils.get_logger(__name__)
 
+    @staticmethod
+    def _build_session(account: Optional[JobBoardAccount]) -> requests.Session:
+        """Create a session whose single-host pool holds one connection per account worker."""
+        session = requests.Session()
+        if account is not None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(account.workers, 1))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return session
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Return the bearer token of the bound account, or the global one from settings."""
+        if self.account is not None:
+            return self.account.access_token
+        return self.settings.JOB_BOARD_ACCESS_TOKEN
+
     def _fake_vacancies(self, profile: SearchProfile) -> List[Vacancy]:
         """Return a small synthetic list of vacancies for offline demo mode."""
         area = profile.areas[0] if profile.areas else "remote"
@@ -63,8 +88,8 @@ class JobBoardClient:
 
     def _headers(self) -> Dict[str, str]:
         headers = {"Accept": "application/json"}
-        if self.settings.JOB_BOARD_ACCESS_TOKEN:
-            headers["Authorization"] = f"Bearer {self.settings.JOB_BOARD_ACCESS_TOKEN}"
+        if self.access_token:
+            headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
 
     def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
@@ -117,6 +142,8 @@ class JobBoardClient:
             }
 
         payload = {"vacancy_id": vacancy.id, "message": cover_letter}
+        if self.account is not None and self.account.resume_id:
+            payload["resume_id"] = self.account.resume_id
         try:
             response = self._request("POST", "/responses", json=payload)
             return response.json()
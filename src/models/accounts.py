@@ -0,0 +1,24 @@
+"""Job-board account definition used for multi-account runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class JobBoardAccount:
+    """Represents a single job-board account with its own token and limits."""
+
+    id: str
+    name: str
+    access_token: Optional[str] = None
+    resume_id: Optional[str] = None
+    daily_quota: int = 50
+    workers: int = 1
+    profiles: List[str] = field(default_factory=list)
+    candidate_profiles: Dict[str, Any] = field(default_factory=dict)
+
+    def serves(self, profile_id: str) -> bool:
+        """Return True if the account may apply for the given search profile."""
+        return not self.profiles or profile_id in self.profiles
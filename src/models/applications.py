@@ -17,3 +17,4 @@ class ApplicationLog:
     applied_at: datetime
     cover_letter_snippet: Optional[str]
     raw_response: Optional[str] = None
+    account_id: Optional[str] = None
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 from .config import Settings, get_settings
-from .db import init_db, save_application, vacancy_already_applied
+from .db import count_applications_today, init_db, save_application, vacancy_already_applied
 from .hh_client import JobBoardClient
 from .logging_utils import get_logger
+from .models.accounts import JobBoardAccount
 from .models.search_profiles import SearchProfile
 from .models.vacancies import Vacancy
 from .openai_client import OpenAIClient
@@ -69,8 +73,156 @@ def filter_vacancies(vacancies: Iterable[Vacancy], profile: SearchProfile) -> Li
     return filtered
 
 
-def run_once(settings: Settings, dry_run_override: bool | None = None) -> Dict[str, int]:
-    """Execute a single run of the demo workflow."""
+def load_accounts(path: Path, settings: Settings) -> List[JobBoardAccount]:
+    """Load job-board accounts from JSON, falling back to the single account from settings.
+
+    Only the implicit ``default`` account uses ``JOB_BOARD_ACCESS_TOKEN``; configured accounts
+    read their token from ``access_token_env`` so that two accounts never share one silently.
+    """
+    logger = get_logger("search_and_apply")
+    raw_accounts: List[Dict[str, Any]] = []
+    if path.is_file():
+        data = load_json(path)
+        raw_accounts = data.get("accounts", []) if isinstance(data, dict) else []
+
+    accounts: List[JobBoardAccount] = []
+    seen_ids: Set[str] = set()
+    for item in raw_accounts:
+        account_id = str(item.get("id") or "").strip()
+        if not account_id:
+            raise ValueError(f"Account without id in {path}")
+        if account_id in seen_ids:
+            raise ValueError(f"Duplicate account id '{account_id}' in {path}")
+        seen_ids.add(account_id)
+        token_env = item.get("access_token_env")
+        access_token = (os.getenv(token_env) or None) if token_env else None
+        if not token_env:
+            logger.warning("Account %s has no access_token_env configured.", account_id)
+        elif not access_token:
+            logger.warning("Account %s has no access token: %s is not set.", account_id, token_env)
+        accounts.append(
+            JobBoardAccount(
+                id=account_id,
+                name=item.get("name", ""),
+                access_token=access_token,
+                resume_id=item.get("resume_id"),
+                daily_quota=int(item.get("daily_quota", 50)),
+                workers=max(int(item.get("workers", 1)), 1),
+                profiles=item.get("profiles") or [],
+                candidate_profiles=item.get("candidate_profiles") or {},
+            )
+        )
+    if not accounts:
+        accounts.append(JobBoardAccount(id="default", name="Default", access_token=settings.JOB_BOARD_ACCESS_TOKEN))
+    return accounts
+
+
+def validate_account_tokens(accounts: List[JobBoardAccount]) -> None:
+    """Reject live runs with accounts lacking a token or sharing one with another account."""
+    owners: Dict[str, str] = {}
+    for account in accounts:
+        if not account.access_token:
+            raise ValueError(f"Account '{account.id}' has no access token; refusing to send live requests.")
+        if account.access_token in owners:
+            raise ValueError(
+                f"Accounts '{owners[account.access_token]}' and '{account.id}' share one access token."
+            )
+        owners[account.access_token] = account.id
+
+
+def assign_vacancies(
+    tasks: Iterable[Tuple[SearchProfile, Vacancy]],
+    accounts: List[JobBoardAccount],
+    remaining_quota: Dict[str, int],
+) -> Dict[str, List[Tuple[SearchProfile, Vacancy]]]:
+    """Distribute vacancies round-robin across accounts that serve the profile and have quota left."""
+    assignments: Dict[str, List[Tuple[SearchProfile, Vacancy]]] = {account.id: [] for account in accounts}
+    remaining = dict(remaining_quota)
+    cursor = 0
+    for profile, vacancy in tasks:
+        for offset in range(len(accounts)):
+            account = accounts[(cursor + offset) % len(accounts)]
+            if account.serves(profile.id) and remaining.get(account.id, 0) > 0:
+                assignments[account.id].append((profile, vacancy))
+                remaining[account.id] -= 1
+                cursor = (cursor + offset + 1) % len(accounts)
+                break
+    return assignments
+
+
+def process_account(
+    account: JobBoardAccount,
+    tasks: List[Tuple[SearchProfile, Vacancy]],
+    settings: Settings,
+    ai_client: OpenAIClient,
+    effective_dry_run: bool,
+    send_applications: bool,
+) -> Dict[str, Any]:
+    """Apply to the vacancies assigned to one account using its own HTTP session and workers."""
+    logger = get_logger(f"search_and_apply.{account.id}")
+    job_client = JobBoardClient(settings, logger=logger, account=account)
+
+    def apply_one(profile: SearchProfile, vacancy: Vacancy) -> str:
+        detailed = job_client.get_vacancy_details(vacancy.id)
+        candidate_profile = account.candidate_profiles.get(profile.id, profile.candidate_profile)
+        cover_letter = ai_client.generate_cover_letter(
+            detailed,
+            candidate_profile=render_candidate_profile(candidate_profile),
+            dry_run=effective_dry_run,
+        )
+        response = job_client.apply_to_vacancy(
+            detailed,
+            cover_letter=cover_letter,
+            dry_run=effective_dry_run or not send_applications,
+        )
+        status = response.get("status") or ("applied" if send_applications and not effective_dry_run else "dry_run")
+        snippet = cover_letter[:180] + ("..." if len(cover_letter) > 180 else "")
+        save_application(
+            vacancy_id=detailed.id,
+            profile_name=profile.name,
+            status=status,
+            cover_letter_snippet=snippet,
+            raw_response=json.dumps(response),
+            account_id=account.id,
+        )
+        logger.info("Logged %s for vacancy %s", status, detailed.id)
+        return status
+
+    started = time.monotonic()
+    logged = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=account.workers) as executor:
+        futures = {executor.submit(apply_one, profile, vacancy): vacancy.id for profile, vacancy in tasks}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:  # keep the other vacancies and accounts going
+                failed += 1
+                logger.error("Account %s failed on vacancy %s: %s", account.id, futures[future], exc)
+            else:
+                logged += 1
+
+    elapsed = time.monotonic() - started
+    per_minute = logged * 60 / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        "Account %s finished: logged=%s failed=%s in %.2fs (%.1f/min)",
+        account.id,
+        logged,
+        failed,
+        elapsed,
+        per_minute,
+    )
+    return {
+        "processed": len(tasks),
+        "logged": logged,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "per_minute": round(per_minute, 1),
+    }
+
+
+def run_once(settings: Settings, dry_run_override: bool | None = None) -> Dict[str, Any]:
+    """Execute a single run of the demo workflow across all configured accounts."""
     logger = get_logger("search_and_apply")
     init_db(demo=False)
 
@@ -84,53 +236,91 @@ def run_once(settings: Settings, dry_run_override: bool | None = None) -> Dict[s
     profiles = [p for p in load_search_profiles(settings.SEARCH_CONFIG_PATH) if p.id in active_ids]
     logger.info("Loaded %s active profiles: %s", len(profiles), ", ".join(p.name for p in profiles))
 
-    job_client = JobBoardClient(settings, logger=logger)
-    ai_client = OpenAIClient(settings, logger=logger)
+    accounts = load_accounts(settings.ACCOUNTS_CONFIG_PATH, settings)
+    if not effective_dry_run:
+        validate_account_tokens(accounts)
+    remaining_quota = {
+        account.id: max(account.daily_quota - count_applications_today(account.id), 0) for account in accounts
+    }
+    logger.info(
+        "Loaded %s accounts: %s",
+        len(accounts),
+        ", ".join(f"{a.id} (quota left {remaining_quota[a.id]})" for a in accounts),
+    )
 
-    total_processed = 0
-    total_logged = 0
+    ai_client = OpenAIClient(settings, logger=logger)
+    search_clients: Dict[str, JobBoardClient] = {}
 
+    # Vacancies are assigned profile by profile so that the max_applications budget is only
+    # spent on vacancies some serving account still has quota for.
+    assignments: Dict[str, List[Tuple[SearchProfile, Vacancy]]] = {account.id: [] for account in accounts}
+    budget = min(max_applications, sum(remaining_quota.values()))
+    assigned = 0
+    seen_ids: Set[str] = set()
     for profile in profiles:
-        logger.info("Running search for profile: %s", profile.name)
-        vacancies = job_client.search_vacancies(profile)
+        if assigned >= budget:
+            logger.info("Reached max applications or account quota (%s).", budget)
+            break
+        serving = [account for account in accounts if account.serves(profile.id)]
+        if not serving:
+            logger.info("Skipping profile %s: no account serves it.", profile.name)
+            continue
+        capacity = sum(remaining_quota[account.id] for account in serving)
+        if capacity == 0:
+            logger.info("Skipping profile %s: no serving account has quota left.", profile.name)
+            continue
+
+        # Search with the serving account that has the most quota left, not always the first one.
+        searcher = max(serving, key=lambda account: remaining_quota[account.id])
+        if searcher.id not in search_clients:
+            search_clients[searcher.id] = JobBoardClient(settings, logger=logger, account=searcher)
+        logger.info("Running search for profile: %s (account %s)", profile.name, searcher.id)
+        vacancies = search_clients[searcher.id].search_vacancies(profile)
         vacancies = filter_vacancies(vacancies, profile)
-        vacancies = [v for v in vacancies if not vacancy_already_applied(v.id)]
+        vacancies = [v for v in vacancies if v.id not in seen_ids and not vacancy_already_applied(v.id)]
 
         per_profile_limit = profile.limit_per_run or max_applications
-        vacancies = vacancies[:per_profile_limit]
-
-        for vacancy in vacancies:
-            if total_logged >= max_applications:
-                logger.info("Reached max applications (%s).", max_applications)
-                return {"processed": total_processed, "logged": total_logged}
-
-            total_processed += 1
-            detailed = job_client.get_vacancy_details(vacancy.id)
-            candidate_profile_text = render_candidate_profile(profile.candidate_profile)
-            cover_letter = ai_client.generate_cover_letter(
-                detailed,
-                candidate_profile=candidate_profile_text,
-                dry_run=effective_dry_run,
-            )
-            response = job_client.apply_to_vacancy(
-                detailed,
-                cover_letter=cover_letter,
-                dry_run=effective_dry_run or not send_applications,
-            )
-            status = response.get("status") or ("applied" if send_applications and not effective_dry_run else "dry_run")
-            snippet = cover_letter[:180] + ("..." if len(cover_letter) > 180 else "")
-            save_application(
-                vacancy_id=detailed.id,
-                profile_name=profile.name,
-                status=status,
-                cover_letter_snippet=snippet,
-                raw_response=json.dumps(response),
-            )
-            total_logged += 1
-            logger.info("Logged %s for vacancy %s", status, detailed.id)
+        take = min(per_profile_limit, budget - assigned, capacity)
+        profile_tasks = [(profile, vacancy) for vacancy in vacancies[:take]]
+        seen_ids.update(vacancy.id for _, vacancy in profile_tasks)
+        for account_id, items in assign_vacancies(profile_tasks, serving, remaining_quota).items():
+            assignments[account_id].extend(items)
+            remaining_quota[account_id] -= len(items)
+            assigned += len(items)
+
+    per_account: Dict[str, Dict[str, Any]] = {}
+    busy_accounts = [account for account in accounts if assignments[account.id]]
+    if busy_accounts:
+        with ThreadPoolExecutor(max_workers=len(busy_accounts)) as executor:
+            futures = {
+                account.id: executor.submit(
+                    process_account,
+                    account,
+                    assignments[account.id],
+                    settings,
+                    ai_client,
+                    effective_dry_run,
+                    send_applications,
+                )
+                for account in busy_accounts
+            }
+            for account_id, future in futures.items():
+                try:
+                    per_account[account_id] = future.result()
+                except Exception as exc:  # e.g. session setup failed; keep other accounts' stats
+                    logger.error("Account %s aborted: %s", account_id, exc)
+                    per_account[account_id] = {
+                        "processed": len(assignments[account_id]),
+                        "logged": 0,
+                        "failed": len(assignments[account_id]),
+                        "elapsed_seconds": 0.0,
+                        "per_minute": 0.0,
+                    }
 
+    total_processed = sum(stats["processed"] for stats in per_account.values())
+    total_logged = sum(stats["logged"] for stats in per_account.values())
     logger.info("Run finished: processed=%s, logged=%s", total_processed, total_logged)
-    return {"processed": total_processed, "logged": total_logged}
+    return {"processed": total_processed, "logged": total_logged, "accounts": per_account}
 
 
 def parse_args() -> argparse.Namespace:
@@ -147,6 +337,8 @@ def main() -> None:
     effective_settings = replace(settings, DRY_RUN=settings.DRY_RUN if args.dry_run is None else args.dry_run)
     summary = run_once(effective_settings, dry_run_override=effective_settings.DRY_RUN)
     print(f"Processed: {summary['processed']} | Logged: {summary['logged']}")
+    for account_id, stats in summary["accounts"].items():
+        print(f"  {account_id}: logged {stats['logged']}, failed {stats['failed']} ({stats['per_minute']}/min)")
 
 
 if __name__ == "__main__":
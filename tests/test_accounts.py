@@ -0,0 +1,209 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+import requests
+
+from src import db
+from src.config import get_settings
+from src.hh_client import JobBoardClient
+from src.models.accounts import JobBoardAccount
+from src.models.search_profiles import SearchProfile
+from src.models.vacancies import Vacancy
+from src.search_and_apply_demo import assign_vacancies, load_accounts, run_once, validate_account_tokens
+
+OLD_APPLICATIONS_SCHEMA = """
+CREATE TABLE applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    vacancy_id TEXT NOT NULL,
+    profile_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    applied_at TEXT NOT NULL,
+    cover_letter_snippet TEXT,
+    raw_response TEXT
+);
+"""
+
+
+def _write_json(path: Path, data) -> Path:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_assign_vacancies_respects_quota_and_profiles():
+    backend = SearchProfile(id="backend", name="Backend", query="python")
+    data = SearchProfile(id="data", name="Data", query="airflow")
+    tasks = [(backend, Vacancy(id=str(i), title="T", company_name="Co")) for i in range(3)]
+    tasks.append((data, Vacancy(id="d1", title="T", company_name="Co")))
+    accounts = [
+        JobBoardAccount(id="a", name="A", profiles=["backend"]),
+        JobBoardAccount(id="b", name="B"),
+    ]
+    assignments = assign_vacancies(tasks, accounts, {"a": 1, "b": 2})
+    assert [v.id for _, v in assignments["a"]] == ["0"]
+    assert [v.id for _, v in assignments["b"]] == ["1", "2"]
+
+
+def test_count_applications_today_per_account(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "demo.db"))
+    get_settings.cache_clear()
+
+    db.init_db(demo=False)
+    db.save_application("v1", "Backend Python", "dry_run", "snippet", None, account_id="primary")
+    db.save_application("v2", "Backend Python", "dry_run", "snippet", None, account_id="secondary")
+    db.save_application("v3", "Data Engineer", "applied", "snippet", None, account_id="primary")
+    db.save_application("v4", "Data Engineer", "sent", "snippet", None, account_id="primary")
+    assert db.count_applications_today("primary") == 2
+    assert db.count_applications_today("secondary") == 0
+
+
+def test_dry_run_rows_do_not_use_quota(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "demo.db"))
+    get_settings.cache_clear()
+
+    db.init_db(demo=False)
+    db.save_application("v1", "Backend Python", "dry_run", "snippet", None, account_id="primary")
+    db.save_application("v2", "Backend Python", "error", "snippet", None, account_id="primary")
+    assert db.count_applications_today("primary") == 0
+
+
+def test_load_accounts_tokens_and_defaults(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("JOB_BOARD_ACCESS_TOKEN", "global-token")
+    monkeypatch.setenv("TOKEN_A", "token-a")
+    monkeypatch.delenv("TOKEN_B", raising=False)
+    get_settings.cache_clear()
+    settings = get_settings()
+    path = _write_json(
+        tmp_path / "accounts.json",
+        {
+            "accounts": [
+                {"id": "a", "access_token_env": "TOKEN_A", "daily_quota": 3, "workers": 4},
+                {"id": "b", "access_token_env": "TOKEN_B"},
+            ]
+        },
+    )
+
+    first, second = load_accounts(path, settings)
+    assert first.access_token == "token-a"
+    assert (first.daily_quota, first.workers) == (3, 4)
+    assert second.access_token is None
+    assert (second.daily_quota, second.workers, second.profiles) == (50, 1, [])
+
+    (fallback,) = load_accounts(tmp_path / "missing.json", settings)
+    assert (fallback.id, fallback.access_token) == ("default", "global-token")
+
+
+@pytest.mark.parametrize("accounts", [[{"name": "no id"}], [{"id": "a"}, {"id": "a"}]])
+def test_load_accounts_rejects_bad_ids(tmp_path: Path, accounts):
+    path = _write_json(tmp_path / "accounts.json", {"accounts": accounts})
+    with pytest.raises(ValueError):
+        load_accounts(path, get_settings())
+
+
+def test_validate_account_tokens_rejects_missing_and_shared_tokens():
+    validate_account_tokens([JobBoardAccount(id="a", name="A", access_token="t1")])
+    with pytest.raises(ValueError):
+        validate_account_tokens([JobBoardAccount(id="a", name="A")])
+    with pytest.raises(ValueError):
+        validate_account_tokens(
+            [JobBoardAccount(id="a", name="A", access_token="t1"), JobBoardAccount(id="b", name="B", access_token="t1")]
+        )
+
+
+def test_init_db_migrates_old_schema(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(OLD_APPLICATIONS_SCHEMA)
+    monkeypatch.setenv("DB_PATH", str(db_path))
+    get_settings.cache_clear()
+
+    db.init_db(demo=False)
+    db.save_application("v1", "Backend Python", "applied", "snippet", None, account_id="primary")
+    assert db.count_applications_today("primary") == 1
+
+
+def _configure_run(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "demo.db"))
+    monkeypatch.setenv("DRY_RUN", "true")
+    monkeypatch.setenv(
+        "ACTIVE_MODE_PATH",
+        str(_write_json(tmp_path / "mode.json", {"active_profiles": ["backend"], "max_applications": 3})),
+    )
+    monkeypatch.setenv(
+        "SEARCH_CONFIG_PATH",
+        str(_write_json(tmp_path / "search.json", {"profiles": [{"id": "backend", "name": "Backend", "query": "py"}]})),
+    )
+    monkeypatch.setenv(
+        "ACCOUNTS_CONFIG_PATH",
+        str(_write_json(tmp_path / "accounts.json", {"accounts": [{"id": "a", "workers": 2}, {"id": "b"}]})),
+    )
+    get_settings.cache_clear()
+
+
+def test_run_once_records_account_per_application(tmp_path: Path, monkeypatch):
+    _configure_run(tmp_path, monkeypatch)
+
+    summary = run_once(get_settings())
+    assert summary["logged"] == 3
+    assert {account_id: stats["logged"] for account_id, stats in summary["accounts"].items()} == {"a": 2, "b": 1}
+    with db.get_connection() as conn:
+        rows = conn.execute("SELECT vacancy_id, account_id FROM applications ORDER BY vacancy_id").fetchall()
+    assert [tuple(row) for row in rows] == [("demo-1", "a"), ("demo-2", "b"), ("demo-3", "a")]
+
+
+def test_run_once_keeps_stats_when_one_vacancy_fails(tmp_path: Path, monkeypatch):
+    _configure_run(tmp_path, monkeypatch)
+    original = JobBoardClient.get_vacancy_details
+
+    def flaky_details(self, vacancy_id):
+        if vacancy_id == "demo-2":
+            raise requests.ConnectionError("board unavailable")
+        return original(self, vacancy_id)
+
+    monkeypatch.setattr(JobBoardClient, "get_vacancy_details", flaky_details)
+
+    summary = run_once(get_settings())
+    assert summary["logged"] == 2
+    assert summary["accounts"]["a"]["logged"] == 2
+    assert (summary["accounts"]["b"]["logged"], summary["accounts"]["b"]["failed"]) == (0, 1)
+
+
+@pytest.mark.parametrize(
+    "accounts, reason",
+    [
+        ([{"id": "d", "profiles": ["data"]}], "no account serves it"),
+        (
+            [{"id": "b", "profiles": ["backend"], "daily_quota": 0}, {"id": "d", "profiles": ["data"]}],
+            "no serving account has quota left",
+        ),
+    ],
+)
+def test_run_once_skips_profiles_without_capacity(tmp_path: Path, monkeypatch, caplog, accounts, reason):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "demo.db"))
+    monkeypatch.setenv("DRY_RUN", "true")
+    monkeypatch.setenv(
+        "ACTIVE_MODE_PATH",
+        str(_write_json(tmp_path / "mode.json", {"active_profiles": ["backend", "data"], "max_applications": 2})),
+    )
+    profiles = [{"id": "backend", "name": "Backend", "query": "py"}, {"id": "data", "name": "Data", "query": "etl"}]
+    monkeypatch.setenv("SEARCH_CONFIG_PATH", str(_write_json(tmp_path / "search.json", {"profiles": profiles})))
+    monkeypatch.setenv(
+        "ACCOUNTS_CONFIG_PATH",
+        str(_write_json(tmp_path / "accounts.json", {"accounts": accounts})),
+    )
+    get_settings.cache_clear()
+    searched_by = []
+    original = JobBoardClient.search_vacancies
+
+    def tracking_search(self, profile):
+        searched_by.append((profile.id, self.account.id))
+        return original(self, profile)
+
+    monkeypatch.setattr(JobBoardClient, "search_vacancies", tracking_search)
+
+    with caplog.at_level("INFO"):
+        summary = run_once(get_settings())
+    assert summary["logged"] == 2
+    assert searched_by == [("data", "d")]
+    assert f"Skipping profile Backend: {reason}." in caplog.text